@@ -1,28 +1,95 @@
+import mmap
 import os
 import platform
-import subprocess
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List  # Add this import
 
+# Matches an existing KUBECONFIG definition line in a shell startup file.
+_KUBECONFIG_LINE_RE = re.compile(rb'^[ \t]*(?:export KUBECONFIG=|set -x KUBECONFIG)[^\r\n]*', re.MULTILINE)
+# Above this many files, paths are resolved in a thread pool.
+PARALLEL_RESOLVE_THRESHOLD = 4
+
 
 def _set_windows_env(value: str) -> bool:
-    """Sets the KUBECONFIG environment variable persistently on Windows using setx."""
-    print("Detected Windows OS. Using 'setx' to set the environment variable.")
+    """Sets the KUBECONFIG environment variable persistently on Windows via the user registry."""
+    print("Detected Windows OS. Writing the environment variable to the user registry.")
     try:
-        # The command is `setx VARIABLE "VALUE"`
-        # We use subprocess.run to execute it.
-        subprocess.run(["setx", "KUBECONFIG", value], capture_output=True, text=True, check=True)
-        print("Successfully executed setx command.")
+        import ctypes
+        import winreg
+
+        # Equivalent to `setx KUBECONFIG "VALUE"`, without spawning a process
+        # or truncating values longer than 1024 characters.
+        key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, "Environment", 0, winreg.KEY_SET_VALUE)
+        try:
+            winreg.SetValueEx(key, "KUBECONFIG", 0, winreg.REG_EXPAND_SZ, value)
+        finally:
+            winreg.CloseKey(key)
+
+        # Notify running processes (e.g. Explorer) that the environment changed.
+        HWND_BROADCAST = 0xFFFF
+        WM_SETTINGCHANGE = 0x1A
+        SMTO_ABORTIFHUNG = 0x0002
+        ctypes.windll.user32.SendMessageTimeoutW(
+            HWND_BROADCAST, WM_SETTINGCHANGE, 0, "Environment", SMTO_ABORTIFHUNG, 5000,
+            ctypes.byref(ctypes.c_size_t()),  # PDWORD_PTR: pointer-sized result buffer
+        )
+        print("Successfully updated the user environment.")
         print("\nIMPORTANT: The new environment variable will be available in any NEW terminal you open.")
         return True
-    except FileNotFoundError:
-        print("Error: 'setx' command not found. It might not be in your system's PATH.", file=sys.stderr)
+    except OSError as e:
+        print(f"Error writing KUBECONFIG to the registry: {e}", file=sys.stderr)
         return False
-    except subprocess.CalledProcessError as e:
-        print(f"Error executing 'setx': {e.stderr}", file=sys.stderr)
+
+
+def _update_shell_config(config_file_path: Path, export_command: str) -> bool:
+    """Replaces the first KUBECONFIG definition in a shell startup file, or appends one.
+
+    The file is memory-mapped and searched in place, so it is only rewritten when the
+    definition actually changes.
+
+    Args:
+        config_file_path (Path): The shell startup file to update.
+        export_command (str): The full line defining KUBECONFIG.
+
+    Returns:
+        bool: True if an existing definition was found, False if one was appended.
+    """
+    command = export_command.encode()
+    try:
+        is_empty = config_file_path.stat().st_size == 0
+    except FileNotFoundError:
+        is_empty = True
+    if is_empty:
+        config_file_path.write_bytes(b"\n" + command + b"\n")
         return False
 
+    with open(config_file_path, 'r+b') as f:
+        with mmap.mmap(f.fileno(), 0) as mm:
+            match = _KUBECONFIG_LINE_RE.search(mm)
+            if match:
+                if mm[match.start():match.end()] == command:
+                    return True
+                if match.end() - match.start() == len(command):
+                    mm[match.start():match.end()] = command
+                    mm.flush()
+                    return True
+                data = mm[:match.start()] + command + mm[match.end():]
+            else:
+                # Match the file's existing line endings
+                first_newline = mm.find(b"\n")
+                eol = b"\r\n" if first_newline > 0 and mm[first_newline - 1:first_newline] == b"\r" else b"\n"
+                # Add a blank line for separation
+                separator = eol if mm[-1:] == b"\n" else eol + eol
+                f.seek(0, os.SEEK_END)
+                f.write(separator + command + eol)
+                return False
+
+    config_file_path.write_bytes(data)
+    return True
+
 
 def _set_unix_env(value: str) -> bool:
     """Sets the KUBECONFIG environment variable persistently on Unix-like systems."""
@@ -48,23 +115,11 @@ def _set_unix_env(value: str) -> bool:
     print(f"Updating shell configuration file: {config_file_path}")
 
     try:
-        lines = config_file_path.read_text().splitlines() if config_file_path.exists() else []
-        found_and_updated = False
-
-        for i, line in enumerate(lines):
-            if line.strip().startswith(('export KUBECONFIG=', 'set -x KUBECONFIG')):
-                lines[i] = export_command
-                found_and_updated = True
-                print("Found and updated existing KUBECONFIG definition.")
-                break
-
-        if not found_and_updated:
-            lines.append('')  # Add a blank line for separation
-            lines.append(export_command)
+        if _update_shell_config(config_file_path, export_command):
+            print("Found and updated existing KUBECONFIG definition.")
+        else:
             print("Added new KUBECONFIG definition to the end of the file.")
 
-        config_file_path.write_text('\n'.join(lines) + '\n')
-
         print("\nIMPORTANT: To apply changes, run the following command or open a new terminal:")
         print(f"  source {config_file_path}")
         return True
@@ -74,6 +129,11 @@ def _set_unix_env(value: str) -> bool:
         return False
 
 
+def _absolute_path(path: Path) -> str:
+    """Returns the path as an absolute path string, resolving it only if it is relative."""
+    return os.fspath(path) if path.is_absolute() else os.fspath(path.resolve(strict=False))
+
+
 def set_persistent_kubeconfig(file_paths: List[Path]) -> bool:
     """
     Sets the KUBECONFIG environment variable persistently across platforms.
@@ -86,8 +146,16 @@ def set_persistent_kubeconfig(file_paths: List[Path]) -> bool:
     """
     # Construct the KUBECONFIG string by joining absolute paths with the OS-specific separator
     # os.pathsep is ':' on Unix and ';' on Windows.
-    # .resolve() ensures we use absolute paths, which is more robust.
-    kubeconfig_value = os.pathsep.join([str(p.resolve()) for p in file_paths])
+    # Relative paths are resolved to absolute ones, which is more robust; paths that are
+    # already absolute are used as-is to avoid the extra filesystem lookups.
+    # Duplicates are dropped (keeping the first occurrence) so kubectl reads each file once.
+    if len(file_paths) > PARALLEL_RESOLVE_THRESHOLD:
+        # Resolving is dominated by filesystem lookups, which run well in parallel threads.
+        with ThreadPoolExecutor(max_workers=min(32, len(file_paths))) as executor:
+            resolved_paths = list(executor.map(_absolute_path, file_paths))
+    else:
+        resolved_paths = [_absolute_path(p) for p in file_paths]
+    kubeconfig_value = os.pathsep.join(dict.fromkeys(resolved_paths))
     print(f"Constructed KUBECONFIG value: {kubeconfig_value}")
 
     system = platform.system()
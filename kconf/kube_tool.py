@@ -2,11 +2,9 @@ from pathlib import Path
 from typing import List, Optional
 
 import typer
-import yaml
 
-from .env_manager import set_persistent_kubeconfig
-from .kubeconfig_manager import KubeConfigManager
-from .utils import load_yaml_file
+# The kubeconfig, YAML and environment modules are imported inside the commands
+# that need them, so `--help` and argument errors don't pay for loading them.
 
 # Create a Typer application instance
 app = typer.Typer(
@@ -18,8 +16,18 @@ app = typer.Typer(
 
 # --- NEW: Define a shared context object for our app ---
 class AppState:
+    __slots__ = ('kubeconfig_path', '_manager')
+
     def __init__(self):
         self.kubeconfig_path = None
+        self._manager = None
+
+    def manager(self):
+        """Returns the KubeConfigManager for this invocation, creating it on first use."""
+        if self._manager is None:
+            from .kubeconfig_manager import KubeConfigManager
+            self._manager = KubeConfigManager(kubeconfig_path=self.kubeconfig_path)
+        return self._manager
 
 
 # --- NEW: Create a callback to handle global options ---
@@ -67,9 +75,10 @@ def add(
     """
     Adds a new context, cluster, and user to your kubeconfig.
     """
+    from .utils import load_yaml_file
+
     typer.echo(f"--- Running ADD action for: {file} ---")
-    # Pass the global kubeconfig path to the manager
-    manager = KubeConfigManager(kubeconfig_path=ctx.obj.kubeconfig_path)
+    manager = ctx.obj.manager()
 
     try:
         new_config_data = load_yaml_file(file)
@@ -98,7 +107,7 @@ def delete(
     Deletes one or more contexts from your kubeconfig.
     """
     typer.echo(f"--- Running DELETE action for contexts: {', '.join(contexts)} ---")
-    manager = KubeConfigManager(kubeconfig_path=ctx.obj.kubeconfig_path)
+    manager = ctx.obj.manager()
 
     deleted_count = 0
     for context_name in contexts:
@@ -137,16 +146,22 @@ def export(
     Exports one or more contexts into a new, self-contained kubeconfig file.
     """
     typer.echo(f"--- Running EXPORT action for contexts: {', '.join(contexts)} ---")
-    manager = KubeConfigManager(kubeconfig_path=ctx.obj.kubeconfig_path)
+    manager = ctx.obj.manager()
 
     # Call the newly renamed method
     new_config_data = manager.export_contexts(contexts)
+    _write_exported_config(new_config_data, output_file)
+
+
+def _write_exported_config(new_config_data: Optional[dict], output_file: Path):
+    """Writes the result of an export to a new kubeconfig file, aborting on failure."""
+    from .utils import dump_yaml
 
     if new_config_data:
         typer.echo(f"Writing new kubeconfig to: {output_file}")
         try:
-            with open(output_file, 'w') as f:
-                yaml.dump(new_config_data, f, default_flow_style=False, sort_keys=False)
+            with open(output_file, 'w', encoding='utf-8') as f:
+                dump_yaml(new_config_data, f)
             typer.secho(f"\n✅ Successfully exported kubeconfig to '{output_file}'.", fg=typer.colors.GREEN)
             typer.echo(f"You can use it with: kubectl --kubeconfig {output_file} get pods")
         except IOError as e:
@@ -156,6 +171,103 @@ def export(
         typer.secho("\n❌ Export operation failed. No contexts were found.", fg=typer.colors.RED)
         raise typer.Abort()
 
+
+@app.command()
+def batch(
+        ctx: typer.Context,
+        script: Path = typer.Argument(
+            ...,
+            help="Path to a YAML or JSON file listing the operations to run.",
+            exists=True,
+            file_okay=True,
+            dir_okay=False,
+            readable=True,
+        ),
+):
+    """
+    Runs a list of add, delete and export operations against a single loaded kubeconfig.
+
+    Each entry in the script is a mapping with an 'action' key ('add', 'delete' or
+    'export') and the same parameters as the matching command: 'file' for add,
+    'contexts' for delete and export, and an optional 'output' for export.
+    Relative paths are resolved against the script's directory.
+    The kubeconfig is parsed once and saved once, after all operations succeed.
+    """
+    from .utils import load_yaml_file
+
+    typer.echo(f"--- Running BATCH action from: {script} ---")
+    try:
+        operations = load_yaml_file(script)
+    except ValueError as e:
+        typer.secho(f"\nError processing file: {e}", fg=typer.colors.RED)
+        raise typer.Abort()
+    if not isinstance(operations, list) or not all(isinstance(op, dict) for op in operations):
+        typer.secho("\nError: The batch script must be a list of operations.", fg=typer.colors.RED)
+        raise typer.Abort()
+    for step, operation in enumerate(operations, start=1):
+        _validate_batch_operation(step, operation)
+
+    base_dir = script.parent
+    manager = ctx.obj.manager()
+    modified = False
+    for step, operation in enumerate(operations, start=1):
+        action = operation['action']
+        typer.echo(f"\n[{step}/{len(operations)}] {action}")
+        if action == 'add':
+            file = base_dir / operation['file']
+            if not file.is_file():
+                typer.secho(f"\nError: File '{file}' does not exist.", fg=typer.colors.RED)
+                raise typer.Abort()
+            try:
+                new_config_data = load_yaml_file(file)
+            except ValueError as e:
+                typer.secho(f"\nError processing file: {e}", fg=typer.colors.RED)
+                raise typer.Abort()
+            if not manager.add_context(new_config_data):
+                typer.secho("\n❌ Add operation failed or was aborted by user.", fg=typer.colors.YELLOW)
+                raise typer.Abort()
+            modified = True
+        elif action == 'delete':
+            for context_name in operation['contexts']:
+                if not manager.delete_context(context_name):
+                    typer.secho(f"\n❌ Could not delete '{context_name}'. It may not exist.", fg=typer.colors.RED)
+                    raise typer.Abort()
+                modified = True
+        else:
+            new_config_data = manager.export_contexts(operation['contexts'])
+            _write_exported_config(new_config_data, base_dir / operation.get('output', 'context'))
+
+    if modified:
+        manager.save()
+    typer.secho(f"\n✅ Successfully ran {len(operations)} operation(s).", fg=typer.colors.GREEN)
+
+
+def _validate_batch_operation(step: int, operation: dict):
+    """Checks that a batch operation has a known action and correctly typed parameters, aborting otherwise."""
+    action = operation.get('action')
+    if action not in ('add', 'delete', 'export'):
+        typer.secho(f"\nError: Operation {step} has an unknown action '{action}'.", fg=typer.colors.RED)
+        raise typer.Abort()
+
+    required = ['file'] if action == 'add' else ['contexts']
+    for key in required:
+        if key not in operation:
+            typer.secho(f"\nError: Operation {step} is missing the '{key}' key.", fg=typer.colors.RED)
+            raise typer.Abort()
+
+    if action == 'add' and not isinstance(operation['file'], str):
+        typer.secho(f"\nError: Operation {step}: 'file' must be a path.", fg=typer.colors.RED)
+        raise typer.Abort()
+    if action in ('delete', 'export'):
+        contexts = operation['contexts']
+        if not isinstance(contexts, list) or not contexts or not all(isinstance(c, str) for c in contexts):
+            typer.secho(f"\nError: Operation {step}: 'contexts' must be a list of context names.", fg=typer.colors.RED)
+            raise typer.Abort()
+    if action == 'export' and not isinstance(operation.get('output', 'context'), str):
+        typer.secho(f"\nError: Operation {step}: 'output' must be a path.", fg=typer.colors.RED)
+        raise typer.Abort()
+
+
 @app.command()
 def setkubeconfig(
         files: List[Path] = typer.Option(
@@ -175,6 +287,8 @@ def setkubeconfig(
     This command joins the provided file paths with the correct OS-specific
     separator and updates your shell's startup file.
     """
+    from .env_manager import set_persistent_kubeconfig
+
     typer.echo("--- Running SETKUBECONFIG action ---")
 
     # The 'files' argument is now a list of Path objects
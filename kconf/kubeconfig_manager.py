@@ -1,12 +1,37 @@
+import hashlib
 import os
+import pickle
 import shutil
+import stat
 import sys
+import tempfile
 from pathlib import Path
-import yaml
 
-from .utils import load_yaml_file
+from .utils import dump_yaml, load_yaml_file
 from .kubeconfig_operations import KubeConfigOperationsMixin
 
+# Parsed kubeconfigs are cached here, keyed by path, inode, mtime, ctime and size.
+# The entries contain credentials, so the directory and files are private to the user.
+CACHE_DIR = Path.home() / ".kube" / "cache" / "kconf"
+# Only the most recently used entries are kept, so caches for removed files don't linger.
+CACHE_MAX_ENTRIES = 16
+# Buffer size used when writing the kubeconfig back to disk.
+WRITE_BUFFER_SIZE = 1 << 20
+
+
+def _prune_cache():
+    """Removes all but the `CACHE_MAX_ENTRIES` most recently used cache entries."""
+    entries = []
+    for entry in CACHE_DIR.glob("*.pkl"):
+        try:
+            entries.append((entry.stat().st_mtime_ns, entry))
+        except FileNotFoundError:
+            pass
+    entries.sort(reverse=True)
+    for _, entry in entries[CACHE_MAX_ENTRIES:]:
+        entry.unlink(missing_ok=True)
+
+
 class KubeConfigManager(KubeConfigOperationsMixin):
     """Manages the state, loading, and saving of a Kubernetes config file."""
 
@@ -37,40 +62,173 @@ class KubeConfigManager(KubeConfigOperationsMixin):
             print(f"Using default kubeconfig path: {self.path}")
         # --- CHANGE END ---
 
-        self.config = self._load()
+        # The file is parsed, and the name index built, on first access.
+        self._config = None
+        self._name_maps = None
+        self._orig_hash = None
+
+    @property
+    def config(self) -> dict:
+        """The parsed kubeconfig data, loaded from disk on first access."""
+        if self._config is None:
+            self._config = self._load()
+        return self._config
+
+    @property
+    def _maps(self) -> dict:
+        """Maps 'clusters', 'users' and 'contexts' to a name -> item dictionary, built on first access.
+
+        The config lists remain the source of truth; the dictionaries only index them.
+        When several entries share a name the first one wins, and entries without a
+        name are not indexed.
+        """
+        if self._name_maps is None:
+            config_data = self.config
+            self._name_maps = {}
+            for key in ['clusters', 'users', 'contexts']:
+                items = self._name_maps[key] = {}
+                for item in config_data[key]:
+                    if isinstance(item, dict) and item.get('name') is not None:
+                        items.setdefault(item['name'], item)
+        return self._name_maps
+
+    def _before_change(self):
+        """Records a fingerprint of the config before its first modification.
+
+        save() compares against it to detect unchanged configs; read-only commands
+        never modify the config and so never pay for computing it.
+        """
+        if self._orig_hash is None:
+            self._orig_hash = hash(repr(self.config))
+
+    def _cache_prefix(self) -> str:
+        """Returns the cache file name prefix identifying this kubeconfig path."""
+        return hashlib.sha1(str(self.path.resolve()).encode()).hexdigest()
+
+    def _load_cached(self) -> dict:
+        """Loads the parsed kubeconfig from the on-disk cache, parsing and caching it on a miss.
+
+        The cache entry is keyed by the file's inode, modification and change times
+        and size, so any change to the kubeconfig results in a fresh parse. On a miss,
+        older entries for the same path are removed before the new one is written,
+        and the cache is pruned to its `CACHE_MAX_ENTRIES` most recently used entries.
+        """
+        try:
+            file_stat = self.path.stat()
+        except FileNotFoundError:
+            self._invalidate_cache()
+            return {}
+
+        key = f"{file_stat.st_ino}-{file_stat.st_mtime_ns}-{file_stat.st_ctime_ns}-{file_stat.st_size}"
+        cache_path = CACHE_DIR / f"{self._cache_prefix()}.{key}.pkl"
+        try:
+            with open(cache_path, 'rb') as f:
+                config_data = pickle.load(f)
+            # Mark the entry as recently used for pruning.
+            os.utime(cache_path)
+            return config_data
+        except FileNotFoundError:
+            pass
+        except Exception:
+            # Unreadable or corrupt entry; drop it and reparse.
+            try:
+                cache_path.unlink(missing_ok=True)
+            except OSError:
+                pass
+
+        config_data = load_yaml_file(self.path)
+        self._invalidate_cache()
+        try:
+            CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+            os.chmod(CACHE_DIR, 0o700)
+            tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+            fd = os.open(tmp_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600)
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    pickle.dump(config_data, f, protocol=5)
+                os.replace(tmp_path, cache_path)
+            except BaseException:
+                Path(tmp_path).unlink(missing_ok=True)
+                raise
+            _prune_cache()
+        except OSError:
+            # The cache is only an optimization; never fail because of it.
+            pass
+        return config_data
+
+    def _invalidate_cache(self):
+        """Removes any cached parse results for this kubeconfig."""
+        try:
+            for stale in CACHE_DIR.glob(f"{self._cache_prefix()}.*.pkl"):
+                stale.unlink(missing_ok=True)
+        except OSError:
+            pass
 
     def _load(self) -> dict:
         """Loads the kubeconfig file into memory and ensures basic structure."""
         try:
-            config_data = load_yaml_file(self.path)
+            config_data = self._load_cached()
             for key in ['clusters', 'users', 'contexts']:
-                if key not in config_data or not isinstance(config_data[key], list):
+                if not isinstance(config_data.setdefault(key, []), list):
                     config_data[key] = []
-            if 'apiVersion' not in config_data:
-                config_data['apiVersion'] = 'v1'
-            if 'kind' not in config_data:
-                config_data['kind'] = 'Config'
+            config_data.setdefault('apiVersion', 'v1')
+            config_data.setdefault('kind', 'Config')
             return config_data
         except ValueError as e:
             print(e, file=sys.stderr)
             sys.exit(1)
 
     def save(self):
-        """Creates a backup and saves the current config state to the file."""
-        if self.path.exists():
+        """Creates a backup and atomically saves the current config state to the file.
+
+        Nothing is written if the config was never modified or is unchanged since loading.
+        """
+        if self._orig_hash is None or hash(repr(self._config)) == self._orig_hash:
+            print("No changes to the kubeconfig; skipping write.")
+            return
+
+        # Write through symlinks so a linked kubeconfig is not replaced by a plain file.
+        target = self.path.resolve()
+        try:
+            target_stat = target.stat()
+        except FileNotFoundError:
+            target_stat = None
+
+        if target_stat is not None:
             backup_path = self.path.with_suffix(f"{self.path.suffix}.bak")
             print(f"Backing up current kubeconfig to {backup_path}")
+            # The new backup is created under a temporary name and renamed over the old
+            # one, so the previous backup is only replaced once a new one exists.
+            tmp_backup_path = backup_path.with_name(f".{backup_path.name}.{os.getpid()}.tmp")
             try:
-                shutil.copy(self.path, backup_path)
+                try:
+                    # The new config is written to a fresh file and renamed over the old one,
+                    # so a hard link is enough to keep the previous content as the backup.
+                    os.link(target, tmp_backup_path)
+                except OSError:
+                    shutil.copy(target, tmp_backup_path)
+                os.replace(tmp_backup_path, backup_path)
             except OSError as e:
+                tmp_backup_path.unlink(missing_ok=True)
                 print(f"Error: Could not create backup: {e}", file=sys.stderr)
                 sys.exit(1)
 
+        self._invalidate_cache()
         print(f"Writing updated configuration to {self.path}")
+        tmp_path = None
         try:
-            self.path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.path, 'w') as f:
-                yaml.dump(self.config, f, default_flow_style=False, sort_keys=False)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                'w', buffering=WRITE_BUFFER_SIZE, encoding='utf-8', dir=target.parent,
+                prefix=f".{target.name}.", suffix=".tmp", delete=False,
+            ) as f:
+                tmp_path = f.name
+                dump_yaml(self.config, f)
+            if target_stat is not None:
+                os.chmod(tmp_path, stat.S_IMODE(target_stat.st_mode))
+            os.replace(tmp_path, target)
         except IOError as e:
+            if tmp_path:
+                Path(tmp_path).unlink(missing_ok=True)
             print(f"Error: Could not write to kubeconfig file: {e}", file=sys.stderr)
-            sys.exit(1)
\ No newline at end of file
+            sys.exit(1)
@@ -1,5 +1,6 @@
 import sys
-from .utils import find_item_by_name, prompt_for_override
+from typing import Callable
+from .utils import prompt_for_override
 
 
 class KubeConfigOperationsMixin:
@@ -7,10 +8,44 @@ class KubeConfigOperationsMixin:
     A mixin class containing high-level operations for a KubeConfigManager.
 
     This class assumes it is mixed into a class that has a `self.config`
-    dictionary representing the kubeconfig data.
+    dictionary representing the kubeconfig data, a `self._maps` dictionary
+    mapping each of 'clusters', 'users' and 'contexts' to a name -> item index
+    over that list, and a `self._before_change()` method that must be called
+    before the config is modified.
     """
 
     config: dict
+    _maps: dict
+    _before_change: Callable[[], None]
+
+    def _replace_item(self, key: str, old_item: dict, new_item: dict):
+        """Replaces an item in one of the config lists, keeping its name index in sync."""
+        self._before_change()
+        item_list = self.config[key]
+        for i, item in enumerate(item_list):
+            if item is old_item:
+                item_list[i] = new_item
+                break
+        self._maps[key][new_item['name']] = new_item
+
+    def _remove_item(self, key: str, old_item: dict):
+        """Removes an item from one of the config lists, keeping its name index in sync.
+
+        If another entry shares the removed item's name, it becomes the indexed one.
+        """
+        self._before_change()
+        item_list = self.config[key]
+        for i, item in enumerate(item_list):
+            if item is old_item:
+                del item_list[i]
+                break
+        name = old_item['name']
+        items = self._maps[key]
+        del items[name]
+        for item in item_list:
+            if isinstance(item, dict) and item.get('name') == name:
+                items[name] = item
+                break
 
     def add_context(self, new_config_data: dict) -> bool:
         """Adds a new cluster, user, and context, checking for duplicates.
@@ -30,25 +65,27 @@ class KubeConfigOperationsMixin:
             return False
 
         items_to_process = [
-            ("cluster", new_cluster, self.config['clusters']),
-            ("user", new_user, self.config['users']),
-            ("context", new_context, self.config['contexts']),
+            ("cluster", new_cluster, 'clusters'),
+            ("user", new_user, 'users'),
+            ("context", new_context, 'contexts'),
         ]
 
-        for item_type, new_item, main_list in items_to_process:
+        for item_type, new_item, key in items_to_process:
             item_name = new_item['name']
-            index, existing_item = find_item_by_name(main_list, item_name)
+            existing_item = self._maps[key].get(item_name)
 
-            if existing_item:
+            if existing_item is not None:
                 if prompt_for_override(item_type, item_name):
                     print(f"Updating existing {item_type} '{item_name}'...")
-                    main_list[index] = new_item
+                    self._replace_item(key, existing_item, new_item)
                 else:
                     print(f"Skipping {item_type} '{item_name}'. Aborting add operation.")
                     return False
             else:
                 print(f"Adding new {item_type} '{item_name}'...")
-                main_list.append(new_item)
+                self._before_change()
+                self.config[key].append(new_item)
+                self._maps[key][item_name] = new_item
         return True
 
     def delete_context(self, context_name: str) -> bool:
@@ -60,8 +97,8 @@ class KubeConfigOperationsMixin:
         Returns:
             bool: True if the context was found and deleted, False otherwise.
         """
-        context_index, context_to_delete = find_item_by_name(self.config['contexts'], context_name)
-        if not context_to_delete:
+        context_to_delete = self._maps['contexts'].get(context_name)
+        if context_to_delete is None:
             print(f"Error: Context '{context_name}' not found.", file=sys.stderr)
             return False
 
@@ -69,29 +106,38 @@ class KubeConfigOperationsMixin:
         user_name = context_to_delete['context']['user']
 
         print(f"Deleting context '{context_name}'...")
-        self.config['contexts'].pop(context_index)
-
-        is_cluster_used = any(c['context']['cluster'] == cluster_name for c in self.config['contexts'])
-        is_user_used = any(c['context']['user'] == user_name for c in self.config['contexts'])
+        self._remove_item('contexts', context_to_delete)
+
+        # Check whether the remaining contexts still reference the cluster or user, in a single pass
+        is_cluster_used = is_user_used = False
+        for c in self.config['contexts']:
+            context_info = c['context']
+            if context_info['cluster'] == cluster_name:
+                is_cluster_used = True
+            if context_info['user'] == user_name:
+                is_user_used = True
+            if is_cluster_used and is_user_used:
+                break
 
         if not is_cluster_used:
-            cluster_index, _ = find_item_by_name(self.config['clusters'], cluster_name)
-            if cluster_index != -1:
+            cluster = self._maps['clusters'].get(cluster_name)
+            if cluster is not None:
                 print(f"Deleting unused cluster '{cluster_name}'...")
-                self.config['clusters'].pop(cluster_index)
+                self._remove_item('clusters', cluster)
         else:
             print(f"Info: Cluster '{cluster_name}' is still in use by another context, not deleting.")
 
         if not is_user_used:
-            user_index, _ = find_item_by_name(self.config['users'], user_name)
-            if user_index != -1:
+            user = self._maps['users'].get(user_name)
+            if user is not None:
                 print(f"Deleting unused user '{user_name}'...")
-                self.config['users'].pop(user_index)
+                self._remove_item('users', user)
         else:
             print(f"Info: User '{user_name}' is still in use by another context, not deleting.")
 
         if self.config.get('current-context') == context_name:
             print("Unsetting 'current-context' as it was deleted.")
+            self._before_change()
             self.config['current-context'] = None
         return True
 
@@ -106,16 +152,11 @@ class KubeConfigOperationsMixin:
             dict | None: A dictionary representing a new, valid kubeconfig file,
                          or None if no valid contexts were found.
         """
+        contexts = self._maps['contexts']
         found_contexts = []
-        cluster_names_to_include = set()
-        user_names_to_include = set()
-
         for name in context_names:
-            _, context_obj = find_item_by_name(self.config['contexts'], name)
-            if context_obj:
-                found_contexts.append(context_obj)
-                cluster_names_to_include.add(context_obj['context']['cluster'])
-                user_names_to_include.add(context_obj['context']['user'])
+            if name in contexts:
+                found_contexts.append(contexts[name])
             else:
                 print(f"Warning: Context '{name}' not found and will be skipped.", file=sys.stderr)
 
@@ -123,9 +164,15 @@ class KubeConfigOperationsMixin:
             print("Error: None of the specified contexts were found. No file will be created.", file=sys.stderr)
             return None
 
-        # Filter clusters and users based on the names we collected
-        found_clusters = [c for c in self.config['clusters'] if c['name'] in cluster_names_to_include]
-        found_users = [u for u in self.config['users'] if u['name'] in user_names_to_include]
+        # Collect the referenced names in the order the contexts were requested, without duplicates
+        cluster_names_to_include = dict.fromkeys(ctx['context']['cluster'] for ctx in found_contexts)
+        user_names_to_include = dict.fromkeys(ctx['context']['user'] for ctx in found_contexts)
+
+        # Look up clusters and users by name
+        clusters = self._maps['clusters']
+        users = self._maps['users']
+        found_clusters = [clusters[n] for n in cluster_names_to_include if n in clusters]
+        found_users = [users[n] for n in user_names_to_include if n in users]
 
         # Assemble the new kubeconfig dictionary
         new_kubeconfig = {
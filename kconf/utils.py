@@ -1,6 +1,18 @@
+import re
 from pathlib import Path
 import yaml
 
+# Prefer the LibYAML C bindings when available; they are much faster on large files.
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
+# Matches data whose first non-blank character opens a JSON object or array.
+_JSON_START_RE = re.compile(rb'\s*[\[{]')
+# Effectively unlimited line width for the YAML emitter (the C emitter needs an int).
+YAML_MAX_WIDTH = (1 << 31) - 1
+
 def load_yaml_file(path: Path) -> dict:
     """Loads a YAML file and returns its content as a dictionary.
 
@@ -13,29 +25,57 @@ def load_yaml_file(path: Path) -> dict:
     Raises:
         ValueError: If the YAML file cannot be parsed.
     """
-    if not path.exists():
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+    except FileNotFoundError:
         return {}
-    with open(path, 'r') as f:
-        try:
-            return yaml.safe_load(f) or {}
-        except yaml.YAMLError as e:
-            raise ValueError(f"Could not parse YAML file at {path}: {e}") from e
+    # Many tools write kubeconfigs as JSON, which is valid YAML but much faster to parse as JSON.
+    if _JSON_START_RE.match(data):
+        json_data = _load_json(data)
+        if json_data is not None:
+            return json_data or {}
+    try:
+        return yaml.load(data, Loader=SafeLoader) or {}
+    except yaml.YAMLError as e:
+        raise ValueError(f"Could not parse YAML file at {path}: {e}") from e
 
-def find_item_by_name(item_list: list, name: str) -> tuple[int, dict | None]:
-    """Finds an item in a list of dictionaries by its 'name' key.
+def dump_yaml(data: dict, stream) -> None:
+    """Writes data as block-style YAML to a text stream, preserving key order.
+
+    Line wrapping is disabled, so long values such as base64 certificates are emitted
+    on a single line and the emitter skips its line-length tracking.
 
     Args:
-        item_list (list): The list of dictionaries to search through.
-        name (str): The value of the 'name' key to find.
+        data (dict): The data to serialize.
+        stream: A writable text stream, opened with UTF-8 encoding.
+    """
+    yaml.dump(
+        data, stream, Dumper=SafeDumper, default_flow_style=False, sort_keys=False,
+        allow_unicode=True, width=YAML_MAX_WIDTH,
+    )
+
+def _load_json(data: bytes):
+    """Parses JSON data with orjson if installed, otherwise the standard library.
+
+    Args:
+        data (bytes): The raw file content.
 
     Returns:
-        tuple[int, dict | None]: A tuple containing the index and the item
-                                 if found, otherwise (-1, None).
+        The parsed content, or None if the data is not valid JSON.
     """
-    for i, item in enumerate(item_list):
-        if item.get("name") == name:
-            return i, item
-    return -1, None
+    try:
+        import orjson
+    except ImportError:
+        import json
+        try:
+            return json.loads(data)
+        except ValueError:
+            return None
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        return None
 
 def prompt_for_override(item_type: str, name: str) -> bool:
     """Asks the user for confirmation to override an existing item via stdin.